@@ -4,6 +4,10 @@ import os
 import mmap
 import struct
 
+# OIEB layout: uint32 size, 4 x uint8 version, 11 x uint64 (metadata/payload
+# counters through writer/reader PIDs)
+OIEB_STRUCT = struct.Struct('<I4B11Q')
+
 def check_buffer(buffer_name):
     path = f"/dev/shm/{buffer_name}"
     
@@ -22,20 +26,17 @@ def check_buffer(buffer_name):
     
     # Try to open and read OIEB
     try:
-        with open(path, 'r+b') as f:
-            # Map the first 128 bytes (OIEB size)
-            with mmap.mmap(f.fileno(), 128, access=mmap.ACCESS_READ) as mm:
+        with open(path, 'rb') as f:
+            # Map the first 128 bytes (OIEB size), prefaulted so the header
+            # read doesn't take a page fault (MAP_POPULATE is Linux-only)
+            flags = mmap.MAP_SHARED | getattr(mmap, 'MAP_POPULATE', 0)
+            with mmap.mmap(f.fileno(), 128, flags=flags, prot=mmap.PROT_READ) as mm:
+                if hasattr(mmap, 'MADV_RANDOM'):
+                    mm.madvise(mmap.MADV_RANDOM)
                 # Read OIEB structure
-                oieb_size = struct.unpack('<I', mm[0:4])[0]
-                version_major = mm[4]
-                version_minor = mm[5]
-                version_patch = mm[6]
-                metadata_size = struct.unpack('<Q', mm[8:16])[0]
-                metadata_free = struct.unpack('<Q', mm[16:24])[0]
-                payload_size = struct.unpack('<Q', mm[32:40])[0]
-                payload_free = struct.unpack('<Q', mm[40:48])[0]
-                writer_pid = struct.unpack('<I', mm[80:84])[0]
-                reader_pid = struct.unpack('<I', mm[88:92])[0]
+                (oieb_size, version_major, version_minor, version_patch, _,
+                 metadata_size, metadata_free, _, payload_size, payload_free,
+                 _, _, _, _, writer_pid, reader_pid) = OIEB_STRUCT.unpack_from(mm)
                 
                 print("\n=== OIEB Structure ===")
                 print(f"OIEB size: {oieb_size} (should be 128)")
@@ -4,7 +4,24 @@
 import sys
 import posix_ipc
 import mmap
-import struct
+import numpy as np
+
+# OIEB header layout (little-endian, packed)
+OIEB_DTYPE = np.dtype([
+    ('oieb_size', '<u4'),
+    ('version', 'u1', (4,)),
+    ('metadata_size', '<u8'),
+    ('metadata_free_bytes', '<u8'),
+    ('metadata_written_bytes', '<u8'),
+    ('payload_size', '<u8'),
+    ('payload_free_bytes', '<u8'),
+    ('payload_write_pos', '<u8'),
+    ('payload_read_pos', '<u8'),
+    ('payload_written_count', '<u8'),
+    ('payload_read_count', '<u8'),
+    ('writer_pid', '<u8'),
+    ('reader_pid', '<u8'),
+])
 
 def check_oieb(buffer_name):
     """Read and display OIEB structure from shared memory"""
@@ -12,44 +29,33 @@ def check_oieb(buffer_name):
         # Open shared memory
         shm = posix_ipc.SharedMemory(buffer_name)
         
-        # Map it to memory
-        mem = mmap.mmap(shm.fd, shm.size)
+        # Map only the 128-byte OIEB, read-only
+        mem = mmap.mmap(shm.fd, 128, prot=mmap.PROT_READ)
         
-        # Read first 128 bytes (OIEB)
+        # Map OIEB fields directly over the shared memory (zero-copy)
+        oieb = np.frombuffer(mem, dtype=OIEB_DTYPE, count=1)[0]
+        version = oieb['version']
         oieb_data = mem[:128]
         
-        # Parse OIEB fields
-        oieb_size = struct.unpack('<I', oieb_data[0:4])[0]
-        version = struct.unpack('4B', oieb_data[4:8])
-        metadata_size = struct.unpack('<Q', oieb_data[8:16])[0]
-        metadata_free_bytes = struct.unpack('<Q', oieb_data[16:24])[0]
-        metadata_written_bytes = struct.unpack('<Q', oieb_data[24:32])[0]
-        payload_size = struct.unpack('<Q', oieb_data[32:40])[0]
-        payload_free_bytes = struct.unpack('<Q', oieb_data[40:48])[0]
-        payload_write_pos = struct.unpack('<Q', oieb_data[48:56])[0]
-        payload_read_pos = struct.unpack('<Q', oieb_data[56:64])[0]
-        payload_written_count = struct.unpack('<Q', oieb_data[64:72])[0]
-        payload_read_count = struct.unpack('<Q', oieb_data[72:80])[0]
-        writer_pid = struct.unpack('<Q', oieb_data[80:88])[0]
-        reader_pid = struct.unpack('<Q', oieb_data[88:96])[0]
-        
         print(f"Buffer: {buffer_name}")
-        print(f"OIEB size field: {oieb_size} (should be 128)")
+        print(f"OIEB size field: {oieb['oieb_size']} (should be 128)")
         print(f"Actual OIEB size: {len(oieb_data)} bytes")
         print(f"Version: {version[0]}.{version[1]}.{version[2]} (reserved: {version[3]})")
-        print(f"Metadata size: {metadata_size}")
-        print(f"Payload size: {payload_size}")
-        print(f"Writer PID: {writer_pid}")
-        print(f"Reader PID: {reader_pid}")
-        print(f"Written count: {payload_written_count}")
-        print(f"Read count: {payload_read_count}")
+        print(f"Metadata size: {oieb['metadata_size']}")
+        print(f"Payload size: {oieb['payload_size']}")
+        print(f"Writer PID: {oieb['writer_pid']}")
+        print(f"Reader PID: {oieb['reader_pid']}")
+        print(f"Written count: {oieb['payload_written_count']}")
+        print(f"Read count: {oieb['payload_read_count']}")
         print("")
         print("First 128 bytes (hex):")
+        # One C-level hex conversion; each 16-byte row is 47 chars + separator
+        hex_str = oieb_data.hex(' ')
         for i in range(0, 128, 16):
-            hex_str = ' '.join(f'{b:02x}' for b in oieb_data[i:i+16])
-            print(f"  {i:03d}: {hex_str}")
+            print(f"  {i:03d}: {hex_str[i * 3:i * 3 + 47]}")
         
-        # Clean up
+        # Clean up (release the numpy view before closing the mapping)
+        del oieb, version
         mem.close()
         shm.close_fd()
         
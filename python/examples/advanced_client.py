@@ -8,8 +8,7 @@ import os
 import sys
 import time
 import uuid
-from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -18,20 +17,115 @@ import numpy.typing as npt
 import rocket_welder_sdk as rw
 from rocket_welder_sdk.ui import ArrowDirection, RegionName, UiService
 
+# Distance the crosshair keeps from the frame edges
+CROSSHAIR_MARGIN = 20.0
+
+# FPS is sampled once per this many frames and smoothed with an EMA
+FPS_SAMPLE_FRAMES = 15
+FPS_SMOOTHING = 0.1
+
+# Overlay font and BGR colors
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+WHITE = (255, 255, 255)
+RED = (0, 0, 255)
+GREEN = (0, 255, 0)
+YELLOW = (0, 255, 255)
+
+
+def advance_crosshair(
+    x: float, y: float, vx: float, vy: float, width: int, height: int
+) -> Tuple[float, float]:
+    """Move the crosshair by its velocity, clamped to stay inside the frame."""
+    # Comparisons instead of min()/max(): no builtin calls on the per-frame path
+    lo = CROSSHAIR_MARGIN
+    x += vx
+    y += vy
+    x_hi = width - lo
+    y_hi = height - lo
+    x = lo if x < lo else (x_hi if x > x_hi else x)
+    y = lo if y < lo else (y_hi if y > y_hi else y)
+    return x, y
+
+
+class TextSprite:
+    """Static text rasterized once and alpha-blended onto frames."""
+
+    def __init__(
+        self,
+        text: str,
+        org: Tuple[int, int],
+        font_scale: float,
+        color: Tuple[int, int, int],
+        thickness: int,
+    ) -> None:
+        """Render the text into a mask positioned so it lands at org like cv2.putText."""
+        self.text = text
+        (text_w, text_h), baseline = cv2.getTextSize(text, FONT, font_scale, thickness)
+        # Strokes extend past the getTextSize box by up to the thickness
+        pad = thickness + 1
+        mask = np.zeros((text_h + baseline + 2 * pad, text_w + 2 * pad), dtype=np.uint8)
+        cv2.putText(mask, text, (pad, text_h + pad), FONT, font_scale, 255, thickness)
+
+        # Crop the sprite if it would start outside the frame
+        x, y = org[0] - pad, org[1] - text_h - pad
+        mask = mask[max(0, -y) :, max(0, -x) :]
+        self._x, self._y = max(0, x), max(0, y)
+
+        # The grayscale mask keeps putText's anti-aliased glyph edges: each pixel
+        # becomes frame * (255 - alpha) / 255 + color * alpha / 255
+        self._inv_alpha = cv2.merge([255 - mask] * 3)
+        pixels = np.empty((*mask.shape, 3), dtype=np.uint8)
+        pixels[:] = color
+        self._pixels = cv2.multiply(pixels, cv2.merge([mask] * 3), scale=1 / 255)
+
+    def draw(self, frame: npt.NDArray[Any]) -> None:
+        """Blend the text onto the frame in place."""
+        height, width = self._inv_alpha.shape[:2]
+        region = frame[self._y : self._y + height, self._x : self._x + width]
+        rh, rw = region.shape[:2]
+        cv2.multiply(region, self._inv_alpha[:rh, :rw], dst=region, scale=1 / 255)
+        cv2.add(region, self._pixels[:rh, :rw], dst=region)
+
 
 class VideoProcessor:
     """Processes video frames with overlays and optional UI controls."""
 
+    __slots__ = (
+        "arrow_grid",
+        "clock_label",
+        "clock_second",
+        "clock_text",
+        "crosshair_x",
+        "crosshair_y",
+        "fps",
+        "fps_label",
+        "fps_sample_start",
+        "frame_count",
+        "mode_label",
+        "session_id",
+        "ui_service",
+        "velocity_x",
+        "velocity_y",
+    )
+
     def __init__(self, session_id: Optional[str] = None) -> None:
         """Initialize video processor."""
         self.frame_count: int = 0
         self.fps: float = 0.0
-        self.last_time: float = time.time()
-        self.crosshair: npt.NDArray[np.float32] = np.array([320.0, 240.0], dtype=np.float32)
-        self.velocity: npt.NDArray[np.float32] = np.array([0.0, 0.0], dtype=np.float32)
+        self.fps_sample_start: float = time.perf_counter()
+        self.clock_second: int = -1
+        self.clock_text: str = ""
+        self.crosshair_x: float = 320.0
+        self.crosshair_y: float = 240.0
+        self.velocity_x: float = 0.0
+        self.velocity_y: float = 0.0
         self.session_id: Optional[str] = session_id
         self.ui_service: Optional[UiService] = None
         self.arrow_grid: Optional[Any] = None  # ArrowGridControl type
+        self.mode_label = TextSprite("DUPLEX", (10, 30), 1.0, RED, 2)
+        # Labels that change at most once per second / FPS sample are re-rendered on change
+        self.clock_label: Optional[TextSprite] = None
+        self.fps_label = TextSprite("FPS: 0.0", (10, 120), 0.5, GREEN, 1)
 
     async def setup_ui(self) -> None:
         """Initialize UI controls if session ID is available."""
@@ -65,74 +159,77 @@ class VideoProcessor:
         """Handle arrow key press."""
         speed = 5.0
         if direction == ArrowDirection.UP:
-            self.velocity[1] = -speed
+            self.velocity_y = -speed
         elif direction == ArrowDirection.DOWN:
-            self.velocity[1] = speed
+            self.velocity_y = speed
         elif direction == ArrowDirection.LEFT:
-            self.velocity[0] = -speed
+            self.velocity_x = -speed
         elif direction == ArrowDirection.RIGHT:
-            self.velocity[0] = speed
+            self.velocity_x = speed
 
     def on_arrow_up(self, sender: Any, direction: ArrowDirection) -> None:
         """Stop movement on arrow release."""
-        self.velocity[:] = 0.0
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+
+    def clock(self) -> str:
+        """Return the wall-clock time as HH:MM:SS, formatted at most once per second."""
+        second = int(time.time())
+        if second != self.clock_second:
+            self.clock_second = second
+            self.clock_text = time.strftime("%H:%M:%S", time.localtime(second))
+        return self.clock_text
 
     def process_duplex(self, input_frame: npt.NDArray[Any], output_frame: npt.NDArray[Any]) -> None:
         """Process frame in duplex mode."""
         self.frame_count += 1
 
-        # Update FPS
-        current_time = time.time()
-        if current_time - self.last_time > 0:
-            self.fps = 1.0 / (current_time - self.last_time)
-            self.last_time = current_time
+        # Update FPS once per sample window
+        if self.frame_count % FPS_SAMPLE_FRAMES == 0:
+            now = time.perf_counter()
+            elapsed = now - self.fps_sample_start
+            if elapsed > 0:
+                rate = FPS_SAMPLE_FRAMES / elapsed
+                self.fps = rate if self.fps == 0.0 else self.fps + FPS_SMOOTHING * (rate - self.fps)
+            self.fps_sample_start = now
+            fps = f"FPS: {self.fps:.1f}"
+            if fps != self.fps_label.text:
+                self.fps_label = TextSprite(fps, (10, 120), 0.5, GREEN, 1)
 
         # Update crosshair position
         h, w = input_frame.shape[:2]
         if self.frame_count == 1:
-            self.crosshair = np.array([w / 2, h / 2], dtype=np.float32)
-        self.crosshair += self.velocity
-        self.crosshair[0] = np.clip(self.crosshair[0], 20, w - 20)
-        self.crosshair[1] = np.clip(self.crosshair[1], 20, h - 20)
+            self.crosshair_x, self.crosshair_y = w / 2, h / 2
+        self.crosshair_x, self.crosshair_y = advance_crosshair(
+            self.crosshair_x, self.crosshair_y, self.velocity_x, self.velocity_y, w, h
+        )
 
-        # Copy and add overlays
+        # Copy and add overlays (contiguous frames: a single memcpy)
         np.copyto(output_frame, input_frame)
 
         # Add text overlays
-        cv2.putText(output_frame, "DUPLEX", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
-        cv2.putText(
-            output_frame,
-            datetime.now().strftime("%H:%M:%S"),
-            (10, 60),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.7,
-            (255, 255, 255),
-            1,
-        )
+        clock = self.clock()
+        if self.clock_label is None or self.clock_label.text != clock:
+            self.clock_label = TextSprite(clock, (10, 60), 0.7, WHITE, 1)
+
+        self.mode_label.draw(output_frame)
+        self.clock_label.draw(output_frame)
+        self.fps_label.draw(output_frame)
+        # The frame counter changes every frame, so it is drawn directly
         cv2.putText(
             output_frame,
             f"Frame: {self.frame_count}",
             (10, 90),
-            cv2.FONT_HERSHEY_SIMPLEX,
+            FONT,
             0.5,
-            (255, 255, 255),
-            1,
-        )
-        cv2.putText(
-            output_frame,
-            f"FPS: {self.fps:.1f}",
-            (10, 120),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.5,
-            (0, 255, 0),
+            WHITE,
             1,
         )
 
         # Draw crosshair
-        x, y = int(self.crosshair[0]), int(self.crosshair[1])
-        cv2.line(output_frame, (x - 20, y), (x + 20, y), (0, 255, 255), 2)
-        cv2.line(output_frame, (x, y - 20), (x, y + 20), (0, 255, 255), 2)
-        cv2.circle(output_frame, (x, y), 3, (0, 0, 255), -1)
+        x, y = int(self.crosshair_x), int(self.crosshair_y)
+        cv2.drawMarker(output_frame, (x, y), YELLOW, cv2.MARKER_CROSS, 40, 2)
+        cv2.circle(output_frame, (x, y), 3, RED, -1)
 
     def process_oneway(self, frame: npt.NDArray[Any]) -> None:
         """Process frame in one-way mode."""
@@ -141,9 +238,9 @@ class VideoProcessor:
             frame,
             f"Frame {self.frame_count}",
             (10, 30),
-            cv2.FONT_HERSHEY_SIMPLEX,
+            FONT,
             0.7,
-            (255, 255, 255),
+            WHITE,
             2,
         )
 
@@ -176,12 +273,20 @@ async def main() -> None:
     # Start processing in background
     client.start(callback)
 
-    # Keep UI updated if available
+    # Wait for the client to stop off the event loop; with UI controls, dispatch
+    # UI events (arrow presses) as they arrive
+    stopped: asyncio.Future[Any] = asyncio.get_running_loop().run_in_executor(None, client.wait)
     try:
-        while client.is_running:
-            if processor.ui_service:
+        if processor.ui_service:
+            while not stopped.done():
+                events: asyncio.Future[Any] = asyncio.ensure_future(
+                    processor.ui_service.wait_for_events()
+                )
+                await asyncio.wait({stopped, events}, return_when=asyncio.FIRST_COMPLETED)
+                events.cancel()
                 await processor.ui_service.do()
-            await asyncio.sleep(0.5)
+        else:
+            await stopped
     except KeyboardInterrupt:
         print("\nShutting down...")
     finally:
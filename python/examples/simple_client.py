@@ -6,7 +6,6 @@ Adds a simple timestamp overlay to frames.
 
 import sys
 import time
-from datetime import datetime
 from typing import Any, Callable, Union
 
 import cv2
@@ -15,6 +14,10 @@ import numpy.typing as npt
 
 import rocket_welder_sdk as rw
 
+# Timestamp overlay font and BGR color
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+WHITE = (255, 255, 255)
+
 
 def main() -> None:
     """Main entry point."""
@@ -23,6 +26,18 @@ def main() -> None:
 
     print(f"Connected: {client.connection}")
 
+    # Timestamp text only changes once per second, so format it only then
+    clock_second = -1
+    clock_text = ""
+
+    def timestamp() -> str:
+        nonlocal clock_second, clock_text
+        second = int(time.time())
+        if second != clock_second:
+            clock_second = second
+            clock_text = time.strftime("%H:%M:%S", time.localtime(second))
+        return clock_text
+
     # Process frames based on mode
     callback: Union[
         Callable[[npt.NDArray[Any]], None],
@@ -34,15 +49,15 @@ def main() -> None:
         def process_frame_duplex(
             input_frame: npt.NDArray[Any], output_frame: npt.NDArray[Any]
         ) -> None:
+            # Contiguous frames of the same dtype: numpy copies with a single memcpy
             np.copyto(output_frame, input_frame)
-            timestamp = datetime.now().strftime("%H:%M:%S")
             cv2.putText(
                 output_frame,
-                timestamp,
+                timestamp(),
                 (10, 30),
-                cv2.FONT_HERSHEY_SIMPLEX,
+                FONT,
                 0.7,
-                (255, 255, 255),
+                WHITE,
                 2,
             )
 
@@ -50,10 +65,7 @@ def main() -> None:
     else:
         # OneWay mode: modify frame in-place
         def process_frame_oneway(frame: npt.NDArray[Any]) -> None:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            cv2.putText(
-                frame, timestamp, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2
-            )
+            cv2.putText(frame, timestamp(), (10, 30), FONT, 0.7, WHITE, 2)
 
         callback = process_frame_oneway
 
@@ -67,9 +79,8 @@ def main() -> None:
             print("Showing preview... Press 'q' to stop")
             client.show()
         else:
-            # No preview, just keep running
-            while client.is_running:
-                time.sleep(0.1)
+            # No preview, block until the client stops
+            client.wait()
     except KeyboardInterrupt:
         print("\nStopping...")
     finally:
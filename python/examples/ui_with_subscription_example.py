@@ -34,7 +34,7 @@ async def main() -> None:
         # Handle clicks with proper type annotation
         def on_click(control: Any) -> None:
             """Handle button click event."""
-            logging.info(f"Button clicked: {control.id}")
+            logging.info("Button clicked: %s", control.id)
             control.color = Color.SUCCESS
             control.text = "Done!"
 
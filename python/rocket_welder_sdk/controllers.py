@@ -8,6 +8,7 @@ from __future__ import annotations
 import json
 import logging
 import threading
+import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Callable, Optional
 
@@ -64,6 +65,26 @@ class IController(ABC):
         """Stop the controller."""
         ...
 
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the controller stops running.
+
+        This default polls is_running; the built-in controllers override it to
+        wait on an event instead.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+
+        Returns:
+            True if the controller has stopped, False if the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.is_running:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
 
 class OneWayShmController(IController):
     """
@@ -90,6 +111,8 @@ class OneWayShmController(IController):
         self._gst_caps: Optional[GstCaps] = None
         self._metadata: Optional[GstMetadata] = None
         self._is_running = False
+        self._stopped = threading.Event()
+        self._stopped.set()
         self._worker_thread: Optional[threading.Thread] = None
         self._cancellation_token: Optional[threading.Event] = None
 
@@ -141,6 +164,7 @@ class OneWayShmController(IController):
         )
 
         # Start processing thread
+        self._stopped.clear()
         self._worker_thread = threading.Thread(
             target=self._process_frames,
             args=(on_frame,),
@@ -167,8 +191,21 @@ class OneWayShmController(IController):
             self._reader = None
 
         self._worker_thread = None
+        self._stopped.set()
         logger.info("Stopped controller for buffer '%s'", self._connection.buffer_name)
 
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the controller stops running.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+
+        Returns:
+            True if the controller has stopped, False if the timeout expired
+        """
+        return self._stopped.wait(timeout)
+
     def _process_frames(self, on_frame: Callable[[Mat], None]) -> None:  # type: ignore[valid-type]
         """
         Process frames from shared memory.
@@ -180,15 +217,18 @@ class OneWayShmController(IController):
             # Process first frame to get metadata
             self._on_first_frame(on_frame)
 
+            # Loop invariants, resolved once instead of per frame
+            timeout_seconds = self._connection.timeout_ms / 1000.0
+            read_frame = self._reader.read_frame  # type: ignore[union-attr]
+            create_mat = self._create_mat_from_frame
+
             # Process remaining frames
             while self._is_running and (
                 not self._cancellation_token or not self._cancellation_token.is_set()
             ):
                 try:
                     # ReadFrame blocks until frame available
-                    # Use timeout in seconds directly
-                    timeout_seconds = self._connection.timeout_ms / 1000.0
-                    frame = self._reader.read_frame(timeout=timeout_seconds)  # type: ignore[union-attr]
+                    frame = read_frame(timeout=timeout_seconds)
 
                     if frame is None or not frame.is_valid:
                         continue  # Skip invalid frames
@@ -196,7 +236,7 @@ class OneWayShmController(IController):
                     # Process frame data using context manager
                     with frame:
                         # Create Mat from frame data (zero-copy when possible)
-                        mat = self._create_mat_from_frame(frame)
+                        mat = create_mat(frame)
                         if mat is not None:
                             on_frame(mat)
 
@@ -243,6 +283,8 @@ class OneWayShmController(IController):
         except Exception as e:
             logger.error("Fatal error in frame processing loop: %s", e)
             self._is_running = False
+        finally:
+            self._stopped.set()
 
     def _on_first_frame(self, on_frame: Callable[[Mat], None]) -> None:  # type: ignore[valid-type]
         """
@@ -268,18 +310,17 @@ class OneWayShmController(IController):
                     metadata_bytes = self._reader.get_metadata()  # type: ignore[union-attr]
                     if metadata_bytes:
                         try:
+                            # Convert memoryview to bytes if needed
+                            if isinstance(metadata_bytes, memoryview):
+                                metadata_bytes = bytes(metadata_bytes)
+
                             # Log raw metadata for debugging
                             logger.debug(
-                                "Raw metadata: %d bytes, type=%s, first 100 bytes: %s",
+                                "Raw metadata: %d bytes, first 100 bytes: %r",
                                 len(metadata_bytes),
-                                type(metadata_bytes),
-                                bytes(metadata_bytes[: min(100, len(metadata_bytes))]),
+                                metadata_bytes[:100],
                             )
 
-                            # Convert memoryview to bytes if needed
-                            if isinstance(metadata_bytes, memoryview):
-                                metadata_bytes = bytes(metadata_bytes)
-
                             # Decode UTF-8
                             metadata_str = metadata_bytes.decode("utf-8")
 
@@ -424,7 +465,9 @@ class OneWayShmController(IController):
 
             for width, height, channels in common_resolutions:
                 if frame_size == width * height * channels:
-                    logger.info(f"Inferred resolution: {width}x{height} with {channels} channels")
+                    logger.info(
+                        "Inferred resolution: %dx%d with %d channels", width, height, channels
+                    )
 
                     # Create caps for future use
                     format_str = "RGB" if channels == 3 else "RGBA" if channels == 4 else "GRAY8"
@@ -441,7 +484,7 @@ class OneWayShmController(IController):
                     elif channels == 4:
                         return data.reshape((height, width, 4))  # type: ignore[no-any-return]
 
-            logger.error(f"Could not infer resolution for frame size {frame_size}")
+            logger.error("Could not infer resolution for frame size %d", frame_size)
             return None
 
         except Exception as e:
@@ -499,6 +542,8 @@ class DuplexShmController(IController):
         self._gst_caps: Optional[GstCaps] = None
         self._metadata: Optional[GstMetadata] = None
         self._is_running = False
+        self._stopped = threading.Event()
+        self._stopped.set()
         self._on_frame_callback: Optional[Callable[[Mat, Mat], None]] = None  # type: ignore[valid-type]
         self._frame_count = 0
 
@@ -556,6 +601,9 @@ class DuplexShmController(IController):
         if self._duplex_server:
             self._duplex_server.start(self._process_duplex_frame, self._on_metadata)
 
+        # Only after setup succeeded, so a failed start() does not leave wait() blocked
+        self._stopped.clear()
+
     def stop(self) -> None:
         """Stop the controller and clean up resources."""
         if not self._is_running:
@@ -569,8 +617,21 @@ class DuplexShmController(IController):
             self._duplex_server.stop()
             self._duplex_server = None
 
+        self._stopped.set()
         logger.info("DuplexShmController stopped")
 
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the controller stops running.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+
+        Returns:
+            True if the controller has stopped, False if the timeout expired
+        """
+        return self._stopped.wait(timeout)
+
     def _on_metadata(self, metadata_bytes: bytes | memoryview) -> None:
         """
         Handle metadata from duplex channel.
@@ -610,11 +671,6 @@ class DuplexShmController(IController):
             request_frame: Input frame from the request
             response_writer: Writer for the response frame
         """
-        logger.debug(
-            "_process_duplex_frame called, frame_count=%d, has_gst_caps=%s",
-            self._frame_count,
-            self._gst_caps is not None,
-        )
         try:
             if not self._on_frame_callback:
                 logger.warning("No frame callback set")
@@ -630,29 +686,9 @@ class DuplexShmController(IController):
 
             # Get buffer for output frame - use context manager for RAII
             with response_writer.get_frame_buffer(request_frame.size) as output_buffer:
-                # Create output Mat from buffer (zero-copy)
-                if self._gst_caps:
-                    height = self._gst_caps.height or 480
-                    width = self._gst_caps.width or 640
-
-                    if self._gst_caps.format == "RGB" or self._gst_caps.format == "BGR":
-                        output_mat = np.frombuffer(output_buffer, dtype=np.uint8).reshape(
-                            (height, width, 3)
-                        )
-                    elif self._gst_caps.format == "GRAY8":
-                        output_mat = np.frombuffer(output_buffer, dtype=np.uint8).reshape(
-                            (height, width)
-                        )
-                    else:
-                        # Default to same shape as input
-                        output_mat = np.frombuffer(output_buffer, dtype=np.uint8).reshape(
-                            input_mat.shape
-                        )
-                else:
-                    # Use same shape as input
-                    output_mat = np.frombuffer(output_buffer, dtype=np.uint8).reshape(
-                        input_mat.shape
-                    )
+                # Create output Mat from buffer (zero-copy). The response has the same
+                # size and layout as the request, so it takes the input Mat's shape.
+                output_mat = np.frombuffer(output_buffer, dtype=np.uint8).reshape(input_mat.shape)
 
                 # Call user's processing function
                 self._on_frame_callback(input_mat, output_mat)
@@ -31,8 +31,8 @@ class BaseContract(BaseModel):
         alias_generator=to_pascal,
         # Allow both snake_case and PascalCase when deserializing
         populate_by_name=True,
-        # Use Enum values for serialization
-        use_enum_values=True,
+        # No use_enum_values: the enums subclass str, so they already
+        # serialize as their values without a coercion pass on construction
     )
 
     id: UUID = Field(default_factory=uuid4)
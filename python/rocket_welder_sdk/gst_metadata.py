@@ -223,10 +223,6 @@ class GstCaps:
         Raises:
             ValueError: If data size doesn't match expected frame size
         """
-        # Convert memoryview to bytes if needed
-        if isinstance(data, memoryview):
-            data = bytes(data)
-
         # If it's already a numpy array, check size and reshape if needed
         if isinstance(data, np.ndarray):
             if data.size * data.itemsize != self.frame_size:
@@ -240,14 +236,15 @@ class GstCaps:
             else:
                 return data.reshape((self.height, self.width, self.channels))
 
-        # Check data size
-        if len(data) != self.frame_size:
+        # Check data size (memoryview length counts items, not bytes)
+        data_size = data.nbytes if isinstance(data, memoryview) else len(data)
+        if data_size != self.frame_size:
             raise ValueError(
                 f"Data size mismatch. Expected {self.frame_size} bytes for "
-                f"{self.width}x{self.height} {self.format}, got {len(data)}"
+                f"{self.width}x{self.height} {self.format}, got {data_size}"
             )
 
-        # Create array from bytes
+        # Wrap bytes or memoryview without copying
         arr = np.frombuffer(data, dtype=self.depth_type)
 
         # Reshape based on channels
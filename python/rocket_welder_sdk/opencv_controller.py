@@ -5,8 +5,10 @@ Provides support for file:// and mjpeg:// protocols.
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import os
+import queue
 import threading
 import time
 from pathlib import Path
@@ -28,6 +30,9 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# Decoded frames buffered ahead of the frame callback
+PREFETCH_FRAMES = 2
+
 
 class OpenCvController(IController):
     """
@@ -36,6 +41,7 @@ class OpenCvController(IController):
     Supports:
     - File playback with optional looping
     - MJPEG network streams over HTTP/TCP
+    - Frame sampling: with stride=N only every Nth frame is delivered
     """
 
     def __init__(self, connection: ConnectionString) -> None:
@@ -54,7 +60,10 @@ class OpenCvController(IController):
         self._capture: cv2.VideoCapture | None = None
         self._metadata: GstMetadata | None = None
         self._is_running = False
+        self._stopped = threading.Event()
+        self._stopped.set()
         self._worker_thread: threading.Thread | None = None
+        self._frames: queue.Queue[npt.NDArray[Any] | None] | None = None
         self._cancellation_token: threading.Event | None = None
 
         # Parse parameters for file protocol
@@ -62,6 +71,9 @@ class OpenCvController(IController):
             connection.protocol == Protocol.FILE
             and connection.parameters.get("loop", "false").lower() == "true"
         )
+        self._stride = 1
+        with contextlib.suppress(ValueError):
+            self._stride = max(1, int(connection.parameters.get("stride", "1")))
 
         # Note: Preview is now handled at the client level via show() method
         # This avoids X11/WSL threading issues with OpenCV GUI functions
@@ -98,10 +110,12 @@ class OpenCvController(IController):
 
         # Get video source
         source = self._get_source()
-        logger.info("Opening video source: %s (loop=%s)", source, self._loop)
+        logger.info(
+            "Opening video source: %s (loop=%s, stride=%d)", source, self._loop, self._stride
+        )
 
         # Create VideoCapture
-        self._capture = cv2.VideoCapture(source)
+        self._capture = self._open_capture(source)
 
         if not self._capture.isOpened():
             self._capture.release()
@@ -109,6 +123,13 @@ class OpenCvController(IController):
             self._is_running = False
             raise RuntimeError(f"Failed to open video source: {source}")
 
+        # Live streams: keep at most one frame buffered in the backend so frames
+        # are not decoded after they have gone stale (not all backends support it)
+        if self._connection.protocol != Protocol.FILE and not self._capture.set(
+            cv2.CAP_PROP_BUFFERSIZE, 1
+        ):
+            logger.debug("Capture backend ignores CAP_PROP_BUFFERSIZE for %s", source)
+
         # Get video properties
         width = int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH))
         height = int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
@@ -132,9 +153,14 @@ class OpenCvController(IController):
 
         # Determine callback type and start worker thread
         if self._connection.connection_mode == ConnectionMode.DUPLEX:
-            # For duplex mode with file/mjpeg, we allocate output but process as one-way
+            # For duplex mode with file/mjpeg, we allocate output but process as one-way.
+            # Like the SHM output slot, the buffer is reused across frames.
+            output: npt.NDArray[Any] | None = None
+
             def duplex_wrapper(frame: npt.NDArray[Any]) -> None:
-                output = np.empty_like(frame)
+                nonlocal output
+                if output is None or output.shape != frame.shape or output.dtype != frame.dtype:
+                    output = np.empty_like(frame)
                 on_frame(frame, output)  # type: ignore[call-arg]
 
             self._worker_thread = threading.Thread(
@@ -149,15 +175,23 @@ class OpenCvController(IController):
                 name=f"RocketWelder-OpenCV-{Path(source).stem}",
             )
 
+        self._frames = queue.Queue(maxsize=PREFETCH_FRAMES)
+        self._stopped.clear()
         self._worker_thread.start()
 
     def stop(self) -> None:
-        """Stop the controller and clean up resources."""
-        if not self._is_running:
+        """
+        Stop the controller and clean up resources.
+
+        Also releases the capture when the source already ended by itself.
+        """
+        if self._worker_thread is None and self._capture is None:
             return
 
         logger.debug("Stopping OpenCV controller")
         self._is_running = False
+        if self._frames is not None:
+            self._wake(self._frames)
 
         # Wait for worker thread
         if self._worker_thread and self._worker_thread.is_alive():
@@ -170,8 +204,57 @@ class OpenCvController(IController):
             self._capture = None
 
         self._worker_thread = None
+        self._frames = None
+        self._stopped.set()
         logger.info("Stopped OpenCV controller")
 
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Block until the controller stops running.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+
+        Returns:
+            True if the controller has stopped, False if the timeout expired
+        """
+        return self._stopped.wait(timeout)
+
+    def _open_capture(self, source: str) -> cv2.VideoCapture:
+        """
+        Open a VideoCapture for the source.
+
+        Files are opened with the FFmpeg backend and any available hardware
+        decoder (VAAPI, NVDEC, ...); FFmpeg decodes in software when there is
+        none. Files FFmpeg cannot open, and all files on OpenCV builds older than
+        4.5.2, use OpenCV's default backends.
+
+        Args:
+            source: Source string from _get_source()
+
+        Returns:
+            VideoCapture, which may not be opened
+        """
+        # Hardware acceleration properties were added in OpenCV 4.5.2
+        hw_acceleration = getattr(cv2, "CAP_PROP_HW_ACCELERATION", None)
+        acceleration_any = getattr(cv2, "VIDEO_ACCELERATION_ANY", None)
+        if (
+            self._connection.protocol == Protocol.FILE
+            and hw_acceleration is not None
+            and acceleration_any is not None
+        ):
+            capture = cv2.VideoCapture(source, cv2.CAP_FFMPEG, [hw_acceleration, acceleration_any])
+            if capture.isOpened():
+                logger.debug(
+                    "Hardware acceleration for %s: %d",
+                    source,
+                    int(capture.get(hw_acceleration)),
+                )
+                return capture
+            capture.release()
+
+        return cv2.VideoCapture(source)
+
     def _get_source(self) -> str:
         """
         Get the video source string for OpenCV.
@@ -208,19 +291,31 @@ class OpenCvController(IController):
         """
         Process video frames in a loop.
 
+        Frames are decoded on a separate reader thread and handed over through a
+        small bounded queue, so decoding the next frame overlaps processing of the
+        current one (OpenCV releases the GIL while decoding).
+
         Args:
             on_frame: Callback for each frame
             fps: Frames per second for timing
         """
-        if not self._capture:
+        if not self._capture or not self._frames:
             return
 
         # Use PeriodicTimer for precise frame timing (especially important for file playback)
         timer = None
         if self._connection.protocol == Protocol.FILE and fps > 0:
-            # Create timer for file playback at specified FPS
-            timer = PeriodicTimerSync(1.0 / fps)
-            logger.debug("Using PeriodicTimer for file playback at %.1f FPS", fps)
+            # Create timer for file playback at specified FPS (per delivered frame)
+            timer = PeriodicTimerSync(self._stride / fps)
+            logger.debug("Using PeriodicTimer for file playback at %.1f FPS", fps / self._stride)
+
+        frames = self._frames
+        reader = threading.Thread(
+            target=self._read_frames,
+            args=(self._capture, frames),
+            name=f"{threading.current_thread().name}-reader",
+        )
+        reader.start()
 
         try:
             while self._is_running:
@@ -228,13 +323,71 @@ class OpenCvController(IController):
                     break
 
                 try:
+                    frame = frames.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if frame is None or not self._is_running:
+                    # Source ended or failed, or stop() woke us up
+                    break
+
+                try:
+                    # Process frame
+                    on_frame(frame)
+                except Exception as e:
+                    logger.error("Error processing frame: %s", e)
+                    if not self._is_running:
+                        break
+                    time.sleep(0.1)
+
+                # Control frame rate for file playback using PeriodicTimer
+                # (network streams are processed as fast as they arrive)
+                if timer and not timer.wait_for_next_tick():
+                    # Timer disposed or timed out
+                    break
+
+        finally:
+            if timer:
+                timer.dispose()
+            # Unblock and wait for the reader before the capture is released
+            self._is_running = False
+            self._wake(frames)
+            reader.join()
+
+        self._stopped.set()
+
+    def _read_frames(
+        self, capture: cv2.VideoCapture, frames: queue.Queue[npt.NDArray[Any] | None]
+    ) -> None:
+        """
+        Decode frames into the queue until the source ends or the controller stops.
+
+        A None sentinel is queued when the source ends or fails.
+
+        Args:
+            capture: Opened video capture to read from
+            frames: Bounded queue shared with the processing loop
+        """
+        skip = 0
+        try:
+            while self._is_running:
+                if self._cancellation_token and self._cancellation_token.is_set():
+                    return
+
+                try:
+                    # Frames skipped by the stride are only grabbed, never
+                    # retrieved, so they are not converted to BGR or copied out
+                    for _ in range(skip):
+                        if not capture.grab():
+                            break
+                    skip = 0
+
                     # Read frame
-                    ret, frame = self._capture.read()
+                    ret, frame = capture.read()
 
                     if not ret:
                         if self._connection.protocol == Protocol.FILE and self._loop:
                             # Loop: Reset to beginning
-                            self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                            capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
                             logger.debug("Looping video from beginning")
                             continue
                         elif self._connection.protocol == Protocol.FILE:
@@ -251,28 +404,50 @@ class OpenCvController(IController):
                         time.sleep(0.01)
                         continue
 
-                    # Process frame
-                    on_frame(frame)
-
-                    # Control frame rate for file playback using PeriodicTimer
-                    if timer:
-                        # Wait for next tick - this provides precise timing
-                        if not timer.wait_for_next_tick():
-                            # Timer disposed or timed out
-                            break
-                    elif self._connection.protocol != Protocol.FILE:
-                        # For network streams, we process as fast as they arrive
-                        # No artificial delay needed
-                        pass
-
                 except Exception as e:
-                    logger.error("Error processing frame: %s", e)
-                    if not self._is_running:
-                        break
+                    logger.error("Error reading frame: %s", e)
                     time.sleep(0.1)
+                    continue
 
+                if not self._put_frame(frames, frame):
+                    return
+                skip = self._stride - 1
         finally:
-            if timer:
-                timer.dispose()
+            self._put_frame(frames, None)
 
-        self._is_running = False
+    @staticmethod
+    def _wake(frames: queue.Queue[npt.NDArray[Any] | None]) -> None:
+        """
+        Wake the reader and processing threads blocked on the frame queue.
+
+        Queued frames are dropped so a reader waiting for space can continue,
+        and a None sentinel is queued for a processing loop waiting for a frame.
+        Both threads then see that the controller is no longer running.
+
+        Args:
+            frames: Frame queue shared by the reader and processing threads
+        """
+        with contextlib.suppress(queue.Empty):
+            while True:
+                frames.get_nowait()
+        with contextlib.suppress(queue.Full):
+            frames.put_nowait(None)
+
+    def _put_frame(
+        self,
+        frames: queue.Queue[npt.NDArray[Any] | None],
+        frame: npt.NDArray[Any] | None,
+    ) -> bool:
+        """
+        Queue a frame, waiting for space while the controller is running.
+
+        Returns:
+            True if the frame was queued, False if the controller stopped first
+        """
+        while self._is_running:
+            try:
+                frames.put(frame, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
@@ -5,10 +5,14 @@ Main entry point for the RocketWelder SDK.
 
 from __future__ import annotations
 
+import contextlib
+import itertools
 import logging
-import queue
+import os
 import threading
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, List, Optional, Union
 
 import numpy as np
 
@@ -51,12 +55,19 @@ class RocketWelderClient:
 
         self._controller: Optional[IController] = None
         self._lock = threading.Lock()
+        # Cleared while start() runs the controller's start outside the lock
+        self._start_done = threading.Event()
+        self._start_done.set()
 
         # Preview support
         self._preview_enabled = (
             self._connection.parameters.get("preview", "false").lower() == "true"
         )
-        self._preview_queue: queue.Queue[Optional[Mat]] = queue.Queue(maxsize=2)  # type: ignore[valid-type]  # Small buffer
+        # Latest-frame slot plus recycled buffers. deque append/pop are atomic,
+        # so the callback thread hands frames to show() without a lock.
+        self._preview_slot: Deque[Mat] = deque(maxlen=1)  # type: ignore[valid-type]
+        self._preview_free: Deque[Mat] = deque()  # type: ignore[valid-type]
+        self._preview_stopped = False
         self._preview_window_name = "RocketWelder Preview"
         self._original_callback: Any = None
 
@@ -102,23 +113,26 @@ class RocketWelderClient:
             ValueError: If connection type is not supported
         """
         with self._lock:
-            if self._controller and self._controller.is_running:
+            if not self._start_done.is_set() or (self._controller and self._controller.is_running):
                 raise RuntimeError("Client is already running")
 
             # Create appropriate controller based on connection
+            controller: IController
             if self._connection.protocol == Protocol.SHM:
                 if self._connection.connection_mode == ConnectionMode.DUPLEX:
-                    self._controller = DuplexShmController(self._connection)
+                    controller = DuplexShmController(self._connection)
                 else:
-                    self._controller = OneWayShmController(self._connection)
+                    controller = OneWayShmController(self._connection)
             elif self._connection.protocol in (Protocol.FILE, Protocol.MJPEG):
-                self._controller = OpenCvController(self._connection)
+                controller = OpenCvController(self._connection)
             else:
                 raise ValueError(f"Unsupported protocol: {self._connection.protocol}")
 
             # If preview is enabled, wrap the callback to capture frames
             if self._preview_enabled:
                 self._original_callback = on_frame
+                self._preview_stopped = False
+                self._preview_slot.clear()
 
                 # Determine if duplex or one-way
                 if self._connection.connection_mode == ConnectionMode.DUPLEX:
@@ -126,16 +140,8 @@ class RocketWelderClient:
                     def preview_wrapper_duplex(input_frame: Mat, output_frame: Mat) -> None:  # type: ignore[valid-type]
                         # Call original callback
                         on_frame(input_frame, output_frame)  # type: ignore[call-arg]
-                        # Queue the OUTPUT frame for preview
-                        try:
-                            self._preview_queue.put_nowait(output_frame.copy())  # type: ignore[attr-defined]
-                        except queue.Full:
-                            # Drop oldest frame if queue is full
-                            try:
-                                self._preview_queue.get_nowait()
-                                self._preview_queue.put_nowait(output_frame.copy())  # type: ignore[attr-defined]
-                            except queue.Empty:
-                                pass
+                        # Publish the OUTPUT frame for preview
+                        self._publish_preview(output_frame)
 
                     actual_callback = preview_wrapper_duplex
                 else:
@@ -143,27 +149,28 @@ class RocketWelderClient:
                     def preview_wrapper_oneway(frame: Mat) -> None:  # type: ignore[valid-type]
                         # Call original callback
                         on_frame(frame)  # type: ignore[call-arg]
-                        # Queue frame for preview
-                        try:
-                            self._preview_queue.put_nowait(frame.copy())  # type: ignore[attr-defined]
-                        except queue.Full:
-                            # Drop oldest frame if queue is full
-                            try:
-                                self._preview_queue.get_nowait()
-                                self._preview_queue.put_nowait(frame.copy())  # type: ignore[attr-defined]
-                            except queue.Empty:
-                                pass
+                        # Publish frame for preview
+                        self._publish_preview(frame)
 
                     actual_callback = preview_wrapper_oneway  # type: ignore[assignment]
             else:
                 actual_callback = on_frame  # type: ignore[assignment]
 
-            # Start the controller
-            self._controller.start(actual_callback, cancellation_token)  # type: ignore[arg-type]
-            logger.info("RocketWelder client started with %s", self._connection)
+            self._controller = controller
+            self._start_done.clear()
+
+        # Start the controller outside the lock: connecting can block on the
+        # buffer handshake, and is_running/get_metadata must not stall meanwhile
+        try:
+            controller.start(actual_callback, cancellation_token)  # type: ignore[arg-type]
+        finally:
+            self._start_done.set()
+        logger.info("RocketWelder client started with %s", self._connection)
 
     def stop(self) -> None:
         """Stop the client and clean up resources."""
+        # Let a concurrent start() finish so the controller is not stopped mid-handshake
+        self._start_done.wait()
         with self._lock:
             if self._controller:
                 self._controller.stop()
@@ -171,10 +178,36 @@ class RocketWelderClient:
 
                 # Signal preview to stop if enabled
                 if self._preview_enabled:
-                    self._preview_queue.put(None)  # Sentinel value
+                    self._preview_stopped = True
 
                 logger.info("RocketWelder client stopped")
 
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the client stops running.
+
+        Returns when stop() is called or, for one-way and file/MJPEG sources, when
+        the cancellation token is set or the source ends (e.g. the writer
+        disconnects or a file finishes playing). Duplex connections ignore the
+        cancellation token and run until stop() is called.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+
+        Returns:
+            True if the client has stopped, False if the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._start_done.wait(timeout):
+            return False
+        with self._lock:
+            controller = self._controller
+        if controller is None:
+            return True
+        if deadline is not None:
+            timeout = max(0.0, deadline - time.monotonic())
+        return controller.wait(timeout)
+
     def show(self, cancellation_token: Optional[threading.Event] = None) -> None:
         """
         Display preview frames in a window (main thread only).
@@ -213,31 +246,32 @@ class RocketWelderClient:
                 if cancellation_token and cancellation_token.is_set():
                     break
 
-                try:
-                    # Get frame with timeout
-                    frame = self._preview_queue.get(timeout=0.1)
-
-                    # Check for stop sentinel
-                    if frame is None:
-                        break
-
-                    # Display frame
-                    cv2.imshow(self._preview_window_name, frame)
-
-                    # Process window events and check for 'q' key
-                    key = cv2.waitKey(1) & 0xFF
-                    if key == ord("q"):
-                        logger.info("User pressed 'q', stopping preview")
-                        break
+                # Check for stop signal
+                if self._preview_stopped:
+                    break
 
-                except queue.Empty:
+                try:
+                    # Take the latest frame; it is ours until handed back
+                    frame = self._preview_slot.pop()
+                except IndexError:
                     # No frame available, check if still running
                     if not self.is_running:
                         break
-                    # Process window events even without new frame
-                    if cv2.waitKey(1) & 0xFF == ord("q"):
+                    # Process window events (waiting briefly) without new frame
+                    if cv2.waitKey(5) & 0xFF == ord("q"):
                         logger.info("User pressed 'q', stopping preview")
                         break
+                    continue
+
+                # Display frame, then return its buffer for reuse
+                cv2.imshow(self._preview_window_name, frame)
+                self._preview_free.append(frame)
+
+                # Process window events and check for 'q' key
+                key = cv2.waitKey(1) & 0xFF
+                if key == ord("q"):
+                    logger.info("User pressed 'q', stopping preview")
+                    break
 
         finally:
             # Clean up window
@@ -245,6 +279,29 @@ class RocketWelderClient:
             cv2.waitKey(1)  # Process pending events
             logger.info("Preview display stopped")
 
+    def _publish_preview(self, frame: Mat) -> None:  # type: ignore[valid-type]
+        """
+        Copy a frame into a recycled buffer and publish it as the latest preview frame.
+
+        At most three buffers circulate (being written, published, being shown),
+        so no memory is allocated per frame unless the frame shape changes.
+
+        Args:
+            frame: Frame to publish for preview
+        """
+        try:
+            buffer: Optional[Mat] = self._preview_free.pop()  # type: ignore[valid-type]
+        except IndexError:
+            buffer = None
+        if buffer is None or buffer.shape != frame.shape or buffer.dtype != frame.dtype:  # type: ignore[attr-defined]
+            buffer = np.empty_like(frame)
+        np.copyto(buffer, frame)
+
+        # Recycle a frame that show() has not picked up yet
+        with contextlib.suppress(IndexError):
+            self._preview_free.append(self._preview_slot.pop())
+        self._preview_slot.append(buffer)
+
     def __enter__(self) -> RocketWelderClient:
         """Context manager entry."""
         return self
@@ -284,14 +341,11 @@ class RocketWelderClient:
         Raises:
             ValueError: If no connection string is found
         """
-        import os
-
         # Check for positional argument (skip script name if present)
-        connection_string = None
-        for arg in args[1:] if len(args) > 0 and args[0].endswith(".py") else args:
-            if not arg.startswith("-"):
-                connection_string = arg
-                break
+        skip = 1 if args and args[0].endswith(".py") else 0
+        connection_string = next(
+            (arg for arg in itertools.islice(args, skip, None) if not arg.startswith("-")), None
+        )
 
         # Fall back to environment variable
         if not connection_string:
@@ -326,8 +380,6 @@ class RocketWelderClient:
         Raises:
             ValueError: If no connection string is found
         """
-        import os
-
         # Check kwargs first
         argv = kwargs.get("args")
 
@@ -1,5 +1,7 @@
 """UI module for RocketWelder SDK."""
 
+from typing import TYPE_CHECKING, Any
+
 from rocket_welder_sdk.external_controls.contracts import ArrowDirection
 
 from .controls import (
@@ -8,7 +10,6 @@ from .controls import (
     IconButtonControl,
     LabelControl,
 )
-from .icons import Custom, Icons, Material
 from .ui_events_projection import UiEventsProjection
 from .ui_service import (
     ItemsControl,
@@ -23,6 +24,9 @@ from .value_types import (
     Typography,
 )
 
+if TYPE_CHECKING:
+    from .icons import Custom, Icons, Material
+
 __all__ = [
     "ArrowDirection",
     "ArrowGridControl",
@@ -46,3 +50,13 @@ __all__ = [
     # Services
     "UiService",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the icon catalogs on first use (PEP 562)."""
+    # icons.py holds ~9 MB of SVG path strings; loading it dominated `import rocket_welder_sdk.ui`
+    if name in ("Custom", "Icons", "Material"):
+        from . import icons
+
+        return getattr(icons, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Callable, ClassVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar
 
 from rocket_welder_sdk.external_controls.contracts import (
     ArrowDirection,
@@ -13,15 +13,27 @@ from rocket_welder_sdk.external_controls.contracts import (
     KeyUp,
 )
 
-from .value_types import Color, ControlType, Size, Typography
+from .value_types import Color, ControlType, RegionName, Size, Typography
 
 if TYPE_CHECKING:
     from .ui_service import UiService
 
+_T = TypeVar("_T")
+
 
 class ControlBase(ABC):
     """Base class for all UI controls."""
 
+    __slots__ = (
+        "_changed",
+        "_is_disposed",
+        "_properties",
+        "_region",
+        "_ui_service",
+        "control_type",
+        "id",
+    )
+
     def __init__(
         self,
         control_id: str,
@@ -44,6 +56,8 @@ class ControlBase(ABC):
         self._properties: dict[str, str] = properties or {}
         self._changed: dict[str, str] = {}
         self._is_disposed: bool = False
+        # Region holding the control, kept by ItemsControl for O(1) removal
+        self._region: RegionName | None = None
 
     @property
     def is_dirty(self) -> bool:
@@ -58,9 +72,23 @@ class ControlBase(ABC):
     @property
     def properties(self) -> dict[str, str]:
         """Get current properties including changes."""
-        props = self._properties.copy()
-        props.update(self._changed)
-        return props
+        return {**self._properties, **self._changed}
+
+    def get_property(self, name: str, default: _T) -> str | _T:
+        """
+        Get a property value, preferring a pending change.
+
+        Args:
+            name: Property name
+            default: Value returned when the property is not set
+
+        Returns:
+            Property value or default
+        """
+        value = self._changed.get(name)
+        if value is None:
+            return self._properties.get(name, default)
+        return value
 
     def set_property(self, name: str, value: Any) -> None:
         """
@@ -71,8 +99,14 @@ class ControlBase(ABC):
             value: Property value (will be converted to string)
         """
         str_value = str(value) if value is not None else ""
-        if self._properties.get(name) != str_value:
-            self._changed[name] = str_value
+        if self._changed.get(name) == str_value:
+            return
+        if self._properties.get(name) == str_value:
+            # Setting back to the committed value cancels the pending change
+            self._changed.pop(name, None)
+            return
+        self._changed[name] = str_value
+        self._ui_service.mark_dirty(self)
 
     def commit_changes(self) -> None:
         """Commit pending changes to properties."""
@@ -99,6 +133,8 @@ class ControlBase(ABC):
 class IconButtonControl(ControlBase):
     """Icon button control with click events."""
 
+    __slots__ = ("on_button_down", "on_button_up")
+
     def __init__(
         self,
         control_id: str,
@@ -126,7 +162,7 @@ class IconButtonControl(ControlBase):
     @property
     def icon(self) -> str:
         """Get icon SVG path."""
-        return self.properties.get("Icon", "")
+        return self.get_property("Icon", "")
 
     @icon.setter
     def icon(self, value: str) -> None:
@@ -136,7 +172,7 @@ class IconButtonControl(ControlBase):
     @property
     def text(self) -> str | None:
         """Get button text."""
-        return self.properties.get("Text")
+        return self.get_property("Text", None)
 
     @text.setter
     def text(self, value: str | None) -> None:
@@ -147,7 +183,7 @@ class IconButtonControl(ControlBase):
     @property
     def color(self) -> Color:
         """Get button color."""
-        color_str = self.properties.get("Color", Color.PRIMARY.value)
+        color_str = self.get_property("Color", Color.PRIMARY.value)
         try:
             return Color(color_str)
         except ValueError:
@@ -156,20 +192,17 @@ class IconButtonControl(ControlBase):
     @color.setter
     def color(self, value: Color | str) -> None:
         """Set button color."""
-        if isinstance(value, Color):
-            self.set_property("Color", value.value)
-        else:
-            # Try to find matching enum
-            for color in Color:
-                if color.value == value:
-                    self.set_property("Color", value)
-                    return
-            raise ValueError(f"Invalid color value: {value}")
+        # Enum lookup by value is a dict hit and also accepts members
+        try:
+            color = Color(value)
+        except ValueError:
+            raise ValueError(f"Invalid color value: {value}") from None
+        self.set_property("Color", color.value)
 
     @property
     def size(self) -> Size:
         """Get button size."""
-        size_str = self.properties.get("Size", Size.MEDIUM.value)
+        size_str = self.get_property("Size", Size.MEDIUM.value)
         try:
             return Size(size_str)
         except ValueError:
@@ -178,15 +211,11 @@ class IconButtonControl(ControlBase):
     @size.setter
     def size(self, value: Size | str) -> None:
         """Set button size."""
-        if isinstance(value, Size):
-            self.set_property("Size", value.value)
-        else:
-            # Try to find matching enum
-            for size in Size:
-                if size.value == value:
-                    self.set_property("Size", value)
-                    return
-            raise ValueError(f"Invalid size value: {value}")
+        try:
+            size = Size(value)
+        except ValueError:
+            raise ValueError(f"Invalid size value: {value}") from None
+        self.set_property("Size", size.value)
 
     def handle_event(self, event: Any) -> None:
         """Handle button events."""
@@ -199,6 +228,8 @@ class IconButtonControl(ControlBase):
 class ArrowGridControl(ControlBase):
     """Arrow grid control for directional input."""
 
+    __slots__ = ("on_arrow_down", "on_arrow_up")
+
     # Mapping from key codes to arrow directions
     KEY_TO_DIRECTION: ClassVar[dict[str, ArrowDirection]] = {
         "ArrowUp": ArrowDirection.UP,
@@ -227,7 +258,7 @@ class ArrowGridControl(ControlBase):
     @property
     def size(self) -> Size:
         """Get grid size."""
-        size_str = self.properties.get("Size", Size.MEDIUM.value)
+        size_str = self.get_property("Size", Size.MEDIUM.value)
         try:
             return Size(size_str)
         except ValueError:
@@ -236,20 +267,16 @@ class ArrowGridControl(ControlBase):
     @size.setter
     def size(self, value: Size | str) -> None:
         """Set grid size."""
-        if isinstance(value, Size):
-            self.set_property("Size", value.value)
-        else:
-            # Try to find matching enum
-            for size in Size:
-                if size.value == value:
-                    self.set_property("Size", value)
-                    return
-            raise ValueError(f"Invalid size value: {value}")
+        try:
+            size = Size(value)
+        except ValueError:
+            raise ValueError(f"Invalid size value: {value}") from None
+        self.set_property("Size", size.value)
 
     @property
     def color(self) -> Color:
         """Get grid color."""
-        color_str = self.properties.get("Color", Color.PRIMARY.value)
+        color_str = self.get_property("Color", Color.PRIMARY.value)
         try:
             return Color(color_str)
         except ValueError:
@@ -258,15 +285,11 @@ class ArrowGridControl(ControlBase):
     @color.setter
     def color(self, value: Color | str) -> None:
         """Set grid color."""
-        if isinstance(value, Color):
-            self.set_property("Color", value.value)
-        else:
-            # Try to find matching enum
-            for color in Color:
-                if color.value == value:
-                    self.set_property("Color", value)
-                    return
-            raise ValueError(f"Invalid color value: {value}")
+        try:
+            color = Color(value)
+        except ValueError:
+            raise ValueError(f"Invalid color value: {value}") from None
+        self.set_property("Color", color.value)
 
     def handle_event(self, event: Any) -> None:
         """Handle keyboard events and translate to arrow events."""
@@ -283,6 +306,8 @@ class ArrowGridControl(ControlBase):
 class LabelControl(ControlBase):
     """Label control for displaying text."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         control_id: str,
@@ -306,7 +331,7 @@ class LabelControl(ControlBase):
     @property
     def text(self) -> str:
         """Get label text."""
-        return self.properties.get("Text", "")
+        return self.get_property("Text", "")
 
     @text.setter
     def text(self, value: str) -> None:
@@ -316,7 +341,7 @@ class LabelControl(ControlBase):
     @property
     def typography(self) -> Typography:
         """Get label typography."""
-        typo_str = self.properties.get("Typography", Typography.BODY1.value)
+        typo_str = self.get_property("Typography", Typography.BODY1.value)
         try:
             return Typography(typo_str)
         except ValueError:
@@ -325,20 +350,16 @@ class LabelControl(ControlBase):
     @typography.setter
     def typography(self, value: Typography | str) -> None:
         """Set label typography."""
-        if isinstance(value, Typography):
-            self.set_property("Typography", value.value)
-        else:
-            # Try to find matching enum
-            for typo in Typography:
-                if typo.value == value:
-                    self.set_property("Typography", value)
-                    return
-            raise ValueError(f"Invalid typography value: {value}")
+        try:
+            typography = Typography(value)
+        except ValueError:
+            raise ValueError(f"Invalid typography value: {value}") from None
+        self.set_property("Typography", typography.value)
 
     @property
     def color(self) -> Color:
         """Get label color."""
-        color_str = self.properties.get("Color", Color.TEXT_PRIMARY.value)
+        color_str = self.get_property("Color", Color.TEXT_PRIMARY.value)
         try:
             return Color(color_str)
         except ValueError:
@@ -347,15 +368,11 @@ class LabelControl(ControlBase):
     @color.setter
     def color(self, value: Color | str) -> None:
         """Set label color."""
-        if isinstance(value, Color):
-            self.set_property("Color", value.value)
-        else:
-            # Try to find matching enum
-            for color in Color:
-                if color.value == value:
-                    self.set_property("Color", value)
-                    return
-            raise ValueError(f"Invalid color value: {value}")
+        try:
+            color = Color(value)
+        except ValueError:
+            raise ValueError(f"Invalid color value: {value}") from None
+        self.set_property("Color", color.value)
 
     def handle_event(self, event: Any) -> None:
         """Labels typically don't handle events."""
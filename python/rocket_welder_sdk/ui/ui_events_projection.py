@@ -69,7 +69,7 @@ class UiEventsProjection:
 
         # Start subscription task
         self._subscription_task = asyncio.create_task(self._run_subscription())
-        logger.info(f"Started UI events projection for session {self._session_id}")
+        logger.info("Started UI events projection for session %s", self._session_id)
 
     async def stop(self) -> None:
         """Stop the subscription and clean up resources."""
@@ -92,11 +92,11 @@ class UiEventsProjection:
                 # Context manager will handle cleanup
                 pass
             except Exception as e:
-                logger.warning(f"Error closing subscription: {e}")
+                logger.warning("Error closing subscription: %s", e)
             finally:
                 self._subscription = None
 
-        logger.info(f"Stopped UI events projection for session {self._session_id}")
+        logger.info("Stopped UI events projection for session %s", self._session_id)
 
     async def _run_subscription(self) -> None:
         """Run the subscription loop."""
@@ -110,7 +110,7 @@ class UiEventsProjection:
                     include_caught_up=True,
                 ) as subscription:
                     self._subscription = subscription
-                    logger.debug(f"Subscribed to stream {self._stream_name}")
+                    logger.debug("Subscribed to stream %s", self._stream_name)
 
                     for recorded_event in subscription:
                         if self._cancellation_token.is_set():
@@ -118,7 +118,7 @@ class UiEventsProjection:
 
                         # Check if this is a caught-up event
                         if hasattr(recorded_event, "is_caught_up") and recorded_event.is_caught_up:
-                            logger.debug(f"Caught up with stream {self._stream_name}")
+                            logger.debug("Caught up with stream %s", self._stream_name)
                             continue
 
                         # Process the event
@@ -128,7 +128,7 @@ class UiEventsProjection:
                 # Task was cancelled, exit cleanly
                 break
             except Exception as e:
-                logger.error(f"Error in subscription: {e}")
+                logger.error("Error in subscription: %s", e)
                 if self._is_running and not self._cancellation_token.is_set():
                     # Wait before retrying
                     await asyncio.sleep(5)
@@ -166,7 +166,7 @@ class UiEventsProjection:
             elif event_type == "KeyUp":
                 event_class = KeyUp
             else:
-                logger.debug(f"Ignoring unknown event type: {event_type}")
+                logger.debug("Ignoring unknown event type: %s", event_type)
                 return
 
             # Create event instance
@@ -177,10 +177,10 @@ class UiEventsProjection:
 
                 # Enqueue event for processing
                 self._event_queue.enqueue_event(event)
-                logger.debug(f"Enqueued {event_type} for control {event.control_id}")
+                logger.debug("Enqueued %s for control %s", event_type, event.control_id)
 
         except Exception as e:
-            logger.error(f"Error handling event {recorded_event.id}: {e}")
+            logger.error("Error handling event %s: %s", recorded_event.id, e)
 
     def _normalize_event_data(self, data: dict[str, Any]) -> dict[str, Any]:
         """
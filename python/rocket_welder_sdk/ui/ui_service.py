@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections import UserList
-from typing import Any
+import asyncio
+from collections import UserList, deque
+from typing import Any, Iterator
 
 from py_micro_plumberd import CommandBus, EventStoreClient
 
@@ -40,6 +41,10 @@ class ItemsControl(UserList[ControlBase]):
         self._ui_service: UiService = ui_service
         self._region_name: RegionName = region_name
 
+    def __iter__(self) -> Iterator[ControlBase]:
+        """Iterate the underlying list directly instead of by index."""
+        return iter(self.data)
+
     def append(self, item: ControlBase) -> None:
         """Add control and schedule DefineControl command."""
         if not isinstance(item, ControlBase):
@@ -48,6 +53,7 @@ class ItemsControl(UserList[ControlBase]):
         # Schedule DefineControl command
         self._ui_service.schedule_define_control(item, self._region_name)
         super().append(item)
+        item._region = self._region_name
 
     def add(self, item: ControlBase) -> None:
         """Add control (alias for append to match C# API)."""
@@ -58,11 +64,13 @@ class ItemsControl(UserList[ControlBase]):
         if item in self.data:
             self._ui_service.schedule_delete(item.id)
             super().remove(item)
+            item._region = None
 
     def clear(self) -> None:
         """Clear all controls and schedule deletions."""
         for control in self.data:
             self._ui_service.schedule_delete(control.id)
+            control._region = None
         super().clear()
 
 
@@ -163,6 +171,10 @@ class UiService:
 
         # Control tracking
         self._index: dict[str, ControlBase] = {}
+        self._defined: set[str] = set()
+
+        # Controls with pending property changes, in the order they were changed
+        self._dirty: dict[str, ControlBase] = {}
 
         # Scheduled operations
         self._scheduled_definitions: list[tuple[ControlBase, RegionName]] = []
@@ -186,8 +198,9 @@ class UiService:
             RegionName.PREVIEW_BOTTOM_CENTER: ItemsControl(self, RegionName.PREVIEW_BOTTOM_CENTER),
         }
 
-        # Event queue
-        self._event_queue: list[Any] = []
+        # Event queue, and a signal for wait_for_events() (created on first wait)
+        self._event_queue: deque[Any] = deque()
+        self._events_pending: asyncio.Event | None = None
 
         # Event projection
         self._events_projection: UiEventsProjection | None = None
@@ -238,6 +251,15 @@ class UiService:
         """
         self._index[control.id] = control
 
+    def mark_dirty(self, control: ControlBase) -> None:
+        """
+        Record that a control has pending property changes.
+
+        Args:
+            control: Control whose properties changed
+        """
+        self._dirty[control.id] = control
+
     def schedule_define_control(self, control: ControlBase, region: RegionName) -> None:
         """
         Schedule a DefineControl command.
@@ -265,6 +287,17 @@ class UiService:
             event: Event to enqueue
         """
         self._event_queue.append(event)
+        if self._events_pending is not None:
+            self._events_pending.set()
+
+    async def wait_for_events(self) -> None:
+        """Wait until at least one event is queued for the next do() call."""
+        if self._event_queue:
+            return
+        if self._events_pending is None:
+            self._events_pending = asyncio.Event()
+        self._events_pending.clear()
+        await self._events_pending.wait()
 
     async def do(self) -> None:
         """Process all scheduled operations and events."""
@@ -282,19 +315,20 @@ class UiService:
 
     def _dispatch_events(self) -> None:
         """Dispatch queued events to controls."""
-        for event in self._event_queue:
-            if hasattr(event, "control_id"):
-                control_id: str = event.control_id
-                control = self._index.get(control_id)
-                if control:
-                    control.handle_event(event)
-        self._event_queue.clear()
+        # Drain from the front so events enqueued by handlers are dispatched too
+        queue = self._event_queue
+        while queue:
+            event = queue.popleft()
+            control = self._index.get(getattr(event, "control_id", ""))
+            if control:
+                control.handle_event(event)
 
     async def _process_scheduled_definitions(self) -> None:
         """Process scheduled DefineControl commands."""
         for control, region in self._scheduled_definitions:
             # Add to index when actually defining
             self._index[control.id] = control
+            self._defined.add(control.id)
 
             command = DefineControl(
                 control_id=control.id,
@@ -323,24 +357,32 @@ class UiService:
 
         # Remove from index and regions
         for control_id in self._scheduled_deletions:
+            self._defined.discard(control_id)
+            self._dirty.pop(control_id, None)
             control = self._index.pop(control_id, None)
-            if control:
-                for region in self._regions.values():
-                    if control in region:
-                        region.data.remove(control)
+            if control and control._region is not None:
+                # Controls still placed (e.g. disposed directly) leave their region
+                self._regions[control._region].data.remove(control)
+                control._region = None
 
         self._scheduled_deletions.clear()
 
     async def _send_property_updates(self) -> None:
         """Send ChangeControls command for dirty controls."""
-        updates: dict[str, dict[str, str]] = {}
-
-        for region in self._regions.values():
-            for control in region:
-                if control.is_dirty:
-                    updates[control.id] = control.changed
+        if not self._dirty or not self.command_bus:
+            return
 
-        if updates and self.command_bus:
+        # Only controls changed since the last update are visited; changes to
+        # controls not yet defined are sent with their DefineControl instead
+        updates: dict[str, dict[str, str]] = {}
+        for control_id, control in list(self._dirty.items()):
+            if control.is_dirty and control_id in self._defined:
+                # No defensive copy: validating ChangeControls copies the dicts
+                updates[control_id] = control._changed
+            else:
+                del self._dirty[control_id]
+
+        if updates:
             command = ChangeControls(updates=updates)
 
             await self.command_bus.send_async(recipient_id=self.session_id, command=command)
@@ -348,6 +390,7 @@ class UiService:
             # Commit changes
             for control_id in updates:
                 self._index[control_id].commit_changes()
+                self._dirty.pop(control_id, None)
 
     async def __aenter__(self) -> UiService:
         """Async context manager entry."""
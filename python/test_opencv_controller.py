@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Test OpenCV controller with file protocol support."""
 
+import os
 import sys
-import time
+import tempfile
+import threading
 from typing import Any
 
 import cv2
@@ -12,14 +14,27 @@ import numpy.typing as npt
 import rocket_welder_sdk as rw
 
 
-def create_test_video(filepath: str, width: int = 640, height: int = 480, fps: int = 30, frames: int = 30) -> None:
-    """Create a test video file with colored frames."""
-    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-    out = cv2.VideoWriter(filepath, fourcc, fps, (width, height))
+def create_test_video(width: int = 640, height: int = 480, fps: int = 30, frames: int = 30) -> str:
+    """Create a test video file with colored frames and return its path.
 
+    The content depends only on the arguments, so a video left by an earlier
+    run with the same arguments is reused instead of encoded again.
+    """
+    filepath = os.path.join(tempfile.gettempdir(), f"test_video_{width}x{height}_{fps}fps_{frames}.avi")
+    if os.path.exists(filepath):
+        print(f"Reusing test video: {filepath}")
+        return filepath
+
+    # Encode to a temporary name so an interrupted run never leaves a partial file
+    partial = f"{filepath}.partial.avi"
+    fourcc = cv2.VideoWriter_fourcc(*"MJPG")
+    out = cv2.VideoWriter(partial, fourcc, fps, (width, height))
+
+    # One frame buffer is cleared and redrawn each iteration (VideoWriter copies on write)
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
     for i in range(frames):
         # Create frame with changing color
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        frame.fill(0)
         color = (int(255 * i / frames), 0, int(255 * (1 - i / frames)))
         cv2.rectangle(frame, (50, 50), (width - 50, height - 50), color, -1)
 
@@ -29,7 +44,9 @@ def create_test_video(filepath: str, width: int = 640, height: int = 480, fps: i
         out.write(frame)
 
     out.release()
+    os.replace(partial, filepath)
     print(f"Created test video: {filepath}")
+    return filepath
 
 
 def test_file_protocol_parsing() -> None:
@@ -64,8 +81,7 @@ def test_file_playback() -> None:
     print("\n=== Testing File Playback ===")
 
     # Create a test video
-    test_file = "/tmp/test_video.mp4"
-    create_test_video(test_file, frames=10)
+    test_file = create_test_video(frames=10)
 
     # Test without loop
     print("\nTesting without loop...")
@@ -80,7 +96,7 @@ def test_file_playback() -> None:
     client.start(process_frame)
 
     # Wait for playback to complete
-    time.sleep(1.0)
+    assert client.wait(timeout=5.0), "Playback did not finish"
     client.stop()
 
     print(f"✓ Received {frame_count} frames without loop")
@@ -90,11 +106,18 @@ def test_file_playback() -> None:
     print("\nTesting with loop...")
     frame_count = 0
 
+    looped = threading.Event()
+
+    def process_looped_frame(frame: npt.NDArray[Any]) -> None:
+        process_frame(frame)
+        if frame_count > 10:
+            looped.set()
+
     client = rw.Client(f"file://{test_file}?loop=true")
-    client.start(process_frame)
+    client.start(process_looped_frame)
 
-    # Let it loop for a bit
-    time.sleep(0.5)
+    # Let it loop past the end of the file
+    looped.wait(timeout=5.0)
     client.stop()
 
     print(f"✓ Received {frame_count} frames with loop (should be > 10)")
@@ -106,8 +129,7 @@ def test_opencv_controller_direct() -> None:
     print("\n=== Testing OpenCvController Direct ===")
 
     # Create test video
-    test_file = "/tmp/test_direct.mp4"
-    create_test_video(test_file, frames=5)
+    test_file = create_test_video(frames=5)
 
     # Create connection string
     conn = rw.ConnectionString.parse(f"file://{test_file}?loop=false")
@@ -115,15 +137,19 @@ def test_opencv_controller_direct() -> None:
     # Create controller
     controller = rw.OpenCvController(conn)
 
+    # Frames are copied into preallocated buffers, one per expected frame
+    pool = [np.empty((480, 640, 3), dtype=np.uint8) for _ in range(5)]
     frames_received = []
 
     def capture_frame(frame: npt.NDArray[Any]) -> None:
-        frames_received.append(frame.copy())
+        buffer = pool[len(frames_received) % len(pool)]
+        np.copyto(buffer, frame)
+        frames_received.append(buffer)
         print(f"  Frame {len(frames_received)}: {frame.shape}")
 
     # Start and run
     controller.start(capture_frame)
-    time.sleep(0.5)
+    controller.wait(timeout=5.0)
     controller.stop()
 
     print(f"✓ Controller received {len(frames_received)} frames")
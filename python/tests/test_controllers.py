@@ -27,6 +27,31 @@ class TestIController:
         with pytest.raises(TypeError):
             IncompleteController()  # type: ignore
 
+    def test_wait_is_optional_for_subclasses(self):
+        """Test that subclasses without wait() get a default that polls is_running."""
+
+        class MinimalController(IController):
+            running = True
+
+            @property
+            def is_running(self):
+                return self.running
+
+            def get_metadata(self):
+                return None
+
+            def start(self, on_frame, cancellation_token=None):
+                self.running = True
+
+            def stop(self):
+                self.running = False
+
+        controller = MinimalController()
+        assert controller.wait(timeout=0.02) is False
+
+        controller.stop()
+        assert controller.wait() is True
+
 
 class TestOneWayShmController:
     """Test OneWayShmController."""
@@ -228,6 +253,31 @@ class TestDuplexShmController:
             controller._process_duplex_frame, controller._on_metadata
         )
 
+    @patch("rocket_welder_sdk.controllers.DuplexChannelFactory")
+    @patch("rocket_welder_sdk.controllers.BufferConfig")
+    def test_wait_returns_after_stop(self, mock_config_class, mock_factory_class, controller):
+        """Test that wait blocks while running and returns once stopped."""
+        assert controller.wait(timeout=0) is True
+
+        controller.start(Mock())
+        assert controller.wait(timeout=0.01) is False
+
+        controller.stop()
+        assert controller.wait(timeout=0) is True
+
+    @patch("rocket_welder_sdk.controllers.DuplexChannelFactory")
+    @patch("rocket_welder_sdk.controllers.BufferConfig")
+    def test_wait_returns_after_failed_start(
+        self, mock_config_class, mock_factory_class, controller
+    ):
+        """Test that wait does not block when start fails during setup."""
+        mock_factory_class.return_value.create_immutable_server.side_effect = OSError("busy")
+
+        with pytest.raises(OSError):
+            controller.start(Mock())
+
+        assert controller.wait(timeout=0) is True
+
     def test_on_metadata(self, controller):
         """Test _on_metadata method."""
         metadata_json = {
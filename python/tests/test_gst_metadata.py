@@ -3,6 +3,8 @@ Unit tests for GstMetadata and GstCaps classes.
 Matches the C# GstMetadataTests functionality.
 """
 
+import pytest
+
 from rocket_welder_sdk.gst_metadata import GstCaps, GstMetadata
 
 
@@ -73,6 +75,24 @@ class TestGstCaps:
         assert caps.channels == 3
         assert caps.bytes_per_pixel == 3
 
+    def test_create_array_from_memoryview_is_zero_copy(self):
+        """Test that create_array wraps a memoryview without copying."""
+        caps = GstCaps.from_simple(4, 2, "BGR")
+        buffer = bytearray(caps.frame_size)
+
+        arr = caps.create_array(memoryview(buffer))
+        buffer[0] = 42
+
+        assert arr.shape == (2, 4, 3)
+        assert arr[0, 0, 0] == 42
+
+    def test_create_array_size_mismatch(self):
+        """Test that create_array rejects data of the wrong size."""
+        caps = GstCaps.from_simple(4, 2, "BGR")
+
+        with pytest.raises(ValueError, match="Data size mismatch"):
+            caps.create_array(memoryview(bytearray(caps.frame_size - 1)))
+
 
 class TestGstMetadata:
     """Test suite for GstMetadata class matching C# tests."""
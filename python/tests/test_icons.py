@@ -94,3 +94,12 @@ def test_custom_brands_available():
     # Test they contain SVG data
     assert isinstance(Custom.Brands.MUD_BLAZOR, str)
     assert len(Custom.Brands.MUD_BLAZOR) > 0
+
+
+def test_icons_reexported_lazily_from_ui_package():
+    """Test that the ui package resolves the icon catalogs on attribute access."""
+    import rocket_welder_sdk.ui as ui
+
+    assert ui.Icons is Icons
+    assert ui.Material is Material
+    assert "Custom" in ui.__all__
@@ -0,0 +1,125 @@
+"""Tests for the OpenCV-based file/MJPEG controller."""
+
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from rocket_welder_sdk import ConnectionString
+from rocket_welder_sdk.opencv_controller import OpenCvController
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    """Write a short MJPG video and return its path."""
+    path = tmp_path / "clip.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 100, (64, 48))
+    for i in range(5):
+        writer.write(np.full((48, 64, 3), i * 40, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+class TestOpenCvController:
+    """Test OpenCvController."""
+
+    def test_rejects_shm_protocol(self):
+        """Test that the controller only accepts file and MJPEG connections."""
+        with pytest.raises(ValueError):
+            OpenCvController(ConnectionString.parse("shm://buffer"))
+
+    def test_duplex_reuses_output_buffer(self, video_file):
+        """Test that duplex playback hands the same output buffer to every frame."""
+        controller = OpenCvController(ConnectionString.parse(f"file://{video_file}?mode=Duplex"))
+        outputs = []
+        done = threading.Event()
+
+        def on_frame(input_frame, output_frame):
+            assert output_frame.shape == input_frame.shape
+            outputs.append(output_frame)
+            if len(outputs) == 3:
+                done.set()
+
+        controller.start(on_frame)
+        try:
+            assert done.wait(timeout=5)
+        finally:
+            controller.stop()
+
+        assert all(output is outputs[0] for output in outputs)
+
+    def test_wait_returns_when_file_ends(self, video_file):
+        """Test that wait returns once a non-looping file has played out."""
+        controller = OpenCvController(ConnectionString.parse(f"file://{video_file}"))
+        frames = []
+
+        controller.start(frames.append)
+        try:
+            assert controller.wait(timeout=5) is True
+        finally:
+            controller.stop()
+
+        assert len(frames) == 5
+        assert controller.is_running is False
+
+    def test_stop_releases_capture_after_file_ends(self, video_file):
+        """Test that stop releases the capture even when playback already ended."""
+        controller = OpenCvController(ConnectionString.parse(f"file://{video_file}"))
+
+        controller.start(lambda frame: None)
+        assert controller.wait(timeout=5) is True
+        assert controller._capture is not None
+
+        controller.stop()
+
+        assert controller._capture is None
+        assert controller._worker_thread is None
+
+    def test_loop_replays_file_until_stopped(self, video_file):
+        """Test that a looping file keeps delivering frames past its end."""
+        controller = OpenCvController(ConnectionString.parse(f"file://{video_file}?loop=true"))
+        frames = []
+        done = threading.Event()
+
+        def on_frame(frame):
+            frames.append(frame)
+            if len(frames) == 12:
+                done.set()
+
+        controller.start(on_frame)
+        try:
+            assert done.wait(timeout=5)
+        finally:
+            controller.stop()
+
+        assert controller.wait(timeout=0) is True
+
+    def test_plays_files_without_hw_acceleration_support(self, video_file, monkeypatch):
+        """Test that files still play on OpenCV builds without hardware acceleration."""
+        monkeypatch.delattr(cv2, "CAP_PROP_HW_ACCELERATION")
+        monkeypatch.delattr(cv2, "VIDEO_ACCELERATION_ANY")
+        controller = OpenCvController(ConnectionString.parse(f"file://{video_file}"))
+        frames = []
+
+        controller.start(frames.append)
+        try:
+            assert controller.wait(timeout=5) is True
+        finally:
+            controller.stop()
+
+        assert len(frames) == 5
+
+    def test_stride_delivers_every_nth_frame(self, video_file):
+        """Test that stride=2 skips every other frame of the file."""
+        controller = OpenCvController(ConnectionString.parse(f"file://{video_file}?stride=2"))
+        frames = []
+
+        controller.start(frames.append)
+        try:
+            assert controller.wait(timeout=5) is True
+        finally:
+            controller.stop()
+
+        # The fixture's frames are flat gray levels 0, 40, 80, 120, 160
+        assert [round(frame.mean() / 40) * 40 for frame in frames] == [0, 80, 160]
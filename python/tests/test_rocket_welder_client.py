@@ -0,0 +1,78 @@
+"""Tests for RocketWelderClient construction helpers."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from rocket_welder_sdk import RocketWelderClient
+
+
+class TestFromArgs:
+    """Test RocketWelderClient.from_args."""
+
+    def test_skips_script_name_and_options(self):
+        """Test that the first positional argument after the script is used."""
+        client = RocketWelderClient.from_args(["app.py", "--verbose", "shm://buffer"])
+        assert client.connection.buffer_name == "buffer"
+
+    def test_first_argument_used_without_script_name(self):
+        """Test that a leading connection string is used when no script is given."""
+        client = RocketWelderClient.from_args(["shm://first", "shm://second"])
+        assert client.connection.buffer_name == "first"
+
+    def test_falls_back_to_environment(self, monkeypatch):
+        """Test that CONNECTION_STRING is used when no positional argument is given."""
+        monkeypatch.setenv("CONNECTION_STRING", "shm://from-env")
+        client = RocketWelderClient.from_args(["app.py", "--verbose"])
+        assert client.connection.buffer_name == "from-env"
+
+    def test_raises_without_connection_string(self, monkeypatch):
+        """Test that a missing connection string is reported."""
+        monkeypatch.delenv("CONNECTION_STRING", raising=False)
+        with pytest.raises(ValueError, match="No connection string"):
+            RocketWelderClient.from_args([])
+
+
+class TestStart:
+    """Test RocketWelderClient.start locking."""
+
+    def test_lock_not_held_while_controller_starts(self):
+        """Test that is_running answers while the controller is still connecting."""
+        connecting = threading.Event()
+        release = threading.Event()
+        controller = Mock(is_running=False)
+
+        def slow_start(on_frame, cancellation_token):
+            connecting.set()
+            release.wait(timeout=5)
+            controller.is_running = True
+
+        controller.start.side_effect = slow_start
+        client = RocketWelderClient("shm://buffer")
+
+        with patch(
+            "rocket_welder_sdk.rocket_welder_client.OneWayShmController",
+            return_value=controller,
+        ):
+            starter = threading.Thread(target=client.start, args=(lambda frame: None,))
+            starter.start()
+            try:
+                assert connecting.wait(timeout=5)
+                assert client.is_running is False
+                with pytest.raises(RuntimeError, match="already running"):
+                    client.start(lambda frame: None)
+
+                # stop() waits for the in-flight start before stopping the controller
+                stopper = threading.Thread(target=client.stop)
+                stopper.start()
+                stopper.join(timeout=0.1)
+                assert stopper.is_alive()
+                controller.stop.assert_not_called()
+            finally:
+                release.set()
+                starter.join(timeout=5)
+            stopper.join(timeout=5)
+
+        controller.stop.assert_called_once()
+        assert client.wait(timeout=0) is True
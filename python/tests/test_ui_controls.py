@@ -75,6 +75,23 @@ class TestIconButtonControl:
         assert button.properties["Text"] == "Click me"
         assert button.properties["Size"] == "Large"
 
+    def test_reverting_property_cancels_pending_change(self, mock_ui_service: Mock) -> None:
+        """Test that setting a property back to its committed value clears the change."""
+        button: IconButtonControl = IconButtonControl(
+            control_id="test-btn",
+            ui_service=mock_ui_service,
+            icon="M12,2A10,10",
+            properties={"Color": "Primary"},
+        )
+
+        button.color = Color.SUCCESS
+        button.color = Color.SUCCESS
+        assert mock_ui_service.mark_dirty.call_count == 1
+
+        button.color = Color.PRIMARY
+        assert not button.is_dirty
+        assert button.color == Color.PRIMARY
+
     def test_icon_button_event_handling(self, mock_ui_service: Mock) -> None:
         """Test icon button event handling."""
         button: IconButtonControl = IconButtonControl(
@@ -1,5 +1,6 @@
 """Happy path tests for UI Service, similar to C# UiServiceHappyPathTests."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
@@ -10,6 +11,7 @@ import pytest_asyncio
 from rocket_welder_sdk.external_controls import (
     ArrowDirection,
     ButtonDown,
+    ButtonUp,
     ChangeControls,
     ControlType,
     DefineControl,
@@ -79,6 +81,7 @@ class TestUiServiceHappyPath:
             # Assert - control should be in the region
             assert control in ui_service[RegionName.TOP_RIGHT]
             assert len(ui_service[RegionName.TOP_RIGHT]) == 1
+            assert list(ui_service[RegionName.TOP_RIGHT]) == [control]
 
     @pytest.mark.asyncio
     async def test_preview_regions_exist(self) -> None:
@@ -110,6 +113,40 @@ class TestUiServiceHappyPath:
         mock_bus.send_async = AsyncMock()
         return mock_bus
 
+    @pytest.mark.asyncio
+    async def test_wait_for_events_wakes_on_enqueue(self) -> None:
+        """Test that wait_for_events blocks until an event is enqueued."""
+        ui_service = UiService.from_session_id("550e8400-e29b-41d4-a716-446655440000")
+
+        waiter = asyncio.ensure_future(ui_service.wait_for_events())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        ui_service.enqueue_event(KeyDown(control_id="grid", code="ArrowUp"))
+        await asyncio.wait_for(waiter, timeout=1)
+
+        # Already-queued events are reported without waiting
+        await asyncio.wait_for(ui_service.wait_for_events(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_events_enqueued_by_handlers_are_dispatched(self) -> None:
+        """Test that an event enqueued while dispatching is handled in the same pass."""
+        ui_service = UiService("test-session")
+        button = ui_service.factory.define_icon_button(control_id="btn", icon="M12,2")
+        pressed: list[str] = []
+
+        def on_down(sender: Any) -> None:
+            pressed.append("down")
+            ui_service.enqueue_event(ButtonUp(control_id="btn"))
+
+        button.on_button_down = on_down
+        button.on_button_up = lambda sender: pressed.append("up")
+        ui_service.enqueue_event(ButtonDown(control_id="btn"))
+
+        await ui_service.do()
+
+        assert pressed == ["down", "up"]
+
     @pytest.fixture
     def mock_eventstore_client(self) -> Mock:
         """Create a mock EventStore client."""
@@ -247,6 +284,7 @@ class TestUiServiceHappyPath:
         assert recipient_id == session_id
         assert isinstance(delete_command, DeleteControls)
         assert control_id in delete_command.control_ids
+        assert icon_button not in ui_service[RegionName.TOP_RIGHT]
 
         # Final verification: Total of 3 different command types sent
         # (DefineControl, ChangeControls, DeleteControls)
@@ -490,3 +528,27 @@ class TestUiServiceHappyPath:
         assert len(change_command.updates) == 2
         assert change_command.updates[label_ids[1]]["Text"] == "Still Active"
         assert change_command.updates[label_ids[3]]["Text"] == "Also Active"
+
+    @pytest.mark.asyncio
+    async def test_changes_before_definition_ride_on_define(self, ui_service: UiService) -> None:
+        """Test that changes made before a control is defined are not re-sent."""
+        label: LabelControl = ui_service.factory.define_label(control_id="status", text="Idle")
+        unplaced: LabelControl = ui_service.factory.define_label(control_id="spare", text="Idle")
+        ui_service[RegionName.TOP].append(label)
+        label.text = "Running"
+        unplaced.text = "Hidden"
+
+        await ui_service.do()
+
+        command_bus: Mock = ui_service.command_bus  # type: ignore
+        assert command_bus.send_async.call_count == 1
+        args, kwargs = command_bus.send_async.call_args
+        define_command = kwargs.get("command", args[1] if len(args) > 1 else None)
+        assert isinstance(define_command, DefineControl)
+        assert define_command.properties["Text"] == "Running"
+        assert not label.is_dirty
+
+        # Nothing changed since, so the next pass sends nothing
+        command_bus.send_async.reset_mock()
+        await ui_service.do()
+        assert command_bus.send_async.call_count == 0